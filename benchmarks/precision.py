@@ -0,0 +1,60 @@
+"""
+Compares the memory and throughput of float64 and float32 bulk curve data.
+
+The byte counts cover the exported arrays only. Curves held in memory always
+store float64 anchors, whichever typecode they were built from.
+
+Run with `pipenv run benchmark` or `python -m benchmarks.precision`.
+"""
+
+from random import Random
+from time import perf_counter
+
+from bendy import CompositeCubicBezier
+from bendy.precision import FLOAT32_ERROR, Typecode
+
+CURVES = 1_000
+RESOLUTION = 100
+
+
+def main() -> None:
+    random = Random(0)
+    values = [random.uniform(-1e4, 1e4) for _ in range(CURVES * 8)]
+
+    # Each curve starts where the previous one ends.
+    for i in range(8, len(values), 8):
+        values[i], values[i + 1] = values[i - 2], values[i - 1]
+    reference = CompositeCubicBezier.from_array(values)
+    expect = [v for p in reference.points(RESOLUTION) for v in p.vector]
+
+    print(f"{CURVES} curves at resolution {RESOLUTION}")
+    print()
+    print("typecode  anchor array (B)  point chunks (B)  points/s    max error")
+
+    typecodes: list[Typecode] = ["d", "f"]
+
+    for typecode in typecodes:
+        anchors = reference.to_array(typecode)
+        composite = CompositeCubicBezier.from_array(anchors)
+
+        start = perf_counter()
+        chunks = list(composite.point_chunks(RESOLUTION, typecode=typecode))
+        elapsed = perf_counter() - start
+
+        size = sum(len(c) * c.itemsize for c in chunks)
+        points = [v for c in chunks for v in c]
+        error = max(abs(a - b) for a, b in zip(points, expect))
+        rate = (len(points) // 2) / elapsed
+
+        print(
+            f"{typecode:<8}  {len(anchors) * anchors.itemsize:>16}  {size:>16}"
+            f"  {rate:>10,.0f}  {error:.3g}"
+        )
+
+    bound = 2 * FLOAT32_ERROR * max(abs(v) for v in values)
+    print()
+    print(f"float32 error bound: {bound:.3g}")
+
+
+if __name__ == "__main__":
+    main()
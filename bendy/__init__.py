@@ -1,6 +1,52 @@
-from bendy.composite_cubic_bezier import CompositeCubicBezier
-from bendy.cubic_bezier import CubicBezier
-from bendy.version_func import version
+from __future__ import annotations
+
+from importlib import import_module
+
+# Avoids importing `typing` at runtime, which dominates cold import time.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+
+    from bendy.composite_cubic_bezier import CompositeCubicBezier
+    from bendy.cubic_bezier import CubicBezier
+    from bendy.version_func import version
+
+# Submodules are imported on first access so that `import bendy` stays cheap
+# for short-lived processes.
+_exports = {
+    "CompositeCubicBezier": "bendy.composite_cubic_bezier",
+    "CubicBezier": "bendy.cubic_bezier",
+    "version": "bendy.version_func",
+}
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_exports))
+
+
+def __getattr__(name: str) -> Any:
+    module = _exports.get(name)
+
+    if module is None:
+        return _import_submodule(name)
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def _import_submodule(name: str) -> Any:
+    # Keeps `import bendy; bendy.cubic_bezier` working as it did before the
+    # exports became lazy.
+    try:
+        return import_module(f"bendy.{name}")
+    except ModuleNotFoundError as ex:
+        if ex.name != f"bendy.{name}":
+            raise
+
+    raise AttributeError(f"module 'bendy' has no attribute '{name}'") from None
+
 
 __all__ = [
     "CompositeCubicBezier",
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from math import ceil
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from types import TracebackType
+from typing import Any, Literal, MutableSequence, Sequence, cast
+
+from vecked import Vector2f
+
+from bendy.composite_cubic_bezier import CompositeCubicBezier
+from bendy.cubic_bezier import CubicBezier
+from bendy.logging import logger
+from bendy.precision import Typecode, extend_float_array, float_array
+
+Operation = Literal["estimate_y", "points"]
+
+Task = tuple[Operation, Typecode, str, str, str, int, int, float, int]
+"""
+(operation, typecode, segments name, values name, counts name, start, stop, x,
+resolution)
+"""
+
+
+def _evaluate_range(
+    operation: Operation,
+    segments: Sequence[float],
+    values: MutableSequence[float],
+    counts: MutableSequence[int],
+    start: int,
+    stop: int,
+    x: float,
+    resolution: int,
+) -> None:
+    """
+    Evaluates the segments in [`start`, `stop`) and writes each result into the
+    segment's fixed slot in `values`, and its length into `counts`.
+    """
+
+    width = _slot_width(operation, resolution)
+
+    for index in range(start, stop):
+        s = index * 8
+
+        curve = CubicBezier(
+            (segments[s], segments[s + 1]),
+            (segments[s + 2], segments[s + 3]),
+            (segments[s + 4], segments[s + 5]),
+            (segments[s + 6], segments[s + 7]),
+        )
+
+        offset = index * width
+        count = 0
+
+        if operation == "points":
+            for point in curve.points(resolution + 1):
+                values[offset + count] = point.x
+                values[offset + count + 1] = point.y
+                count += 2
+
+        else:
+            for y in curve.estimate_y(x, resolution=resolution):
+                values[offset + count] = y
+                count += 1
+
+        counts[index] = count
+
+
+def _evaluate_shared(task: Task) -> None:
+    operation, typecode, segments_name, values_name, counts_name = task[:5]
+    start, stop, x, resolution = task[5:]
+
+    # The parent process owns and unlinks every block.
+    blocks = [SharedMemory(name=n) for n in (segments_name, values_name, counts_name)]
+
+    try:
+        views: list[memoryview[Any]] = [
+            _buffer(blocks[0]).cast(typecode),
+            _buffer(blocks[1]).cast(typecode),
+            _buffer(blocks[2]).cast("q"),
+        ]
+
+        try:
+            _evaluate_range(
+                operation,
+                cast(Sequence[float], views[0]),
+                cast(MutableSequence[float], views[1]),
+                cast(MutableSequence[int], views[2]),
+                start,
+                stop,
+                x,
+                resolution,
+            )
+        finally:
+            for view in views:
+                view.release()
+
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def _buffer(block: SharedMemory) -> memoryview[int]:
+    if block.buf is None:  # pragma: no cover
+        raise ValueError(f"shared memory {block.name} is closed")
+
+    return block.buf
+
+
+def _slot_width(operation: Operation, resolution: int) -> int:
+    if operation == "points":
+        return (resolution + 1) * 2
+
+    # Both anchor checks plus at most one estimate per line.
+    return resolution + 2
+
+
+class BatchEvaluator:
+    """
+    Evaluates large batches of independent curves over a process pool.
+
+    Anchors and results travel through shared memory rather than as pickled
+    vectors. Results are always returned in the order of the input curves.
+
+    Batches with fewer than `min_batch` curve segments are evaluated serially
+    in this process, where the cost of the pool would outweigh its benefit.
+
+    `typecode` "f" stores anchors and results as float32, which halves the
+    shared memory and result buffers. Anchors are rounded to float32 before
+    evaluation, so results are within the bound described by `FLOAT32_ERROR`
+    in `bendy.precision`. Returned values are still Python floats.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        min_batch: int = 1000,
+        typecode: Typecode = "d",
+    ) -> None:
+        self._max_workers = max_workers or cpu_count() or 1
+        self._min_batch = min_batch
+        self._typecode = typecode
+        self._itemsize = float_array(typecode).itemsize
+        self._pool: Executor | None = None
+
+    def __enter__(self) -> BatchEvaluator:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the process pool, if one was started.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def estimate_y(
+        self,
+        curves: Sequence[CubicBezier | CompositeCubicBezier],
+        x: float,
+        resolution: int = 100,
+    ) -> list[list[float]]:
+        """
+        Estimates every y value for `x` on each curve.
+
+        Each list matches the values yielded by the curve's own `estimate_y`.
+        """
+
+        result: list[list[float]] = []
+
+        for estimates in self._evaluate("estimate_y", curves, x, resolution):
+            result.append([y for segment in estimates for y in segment])
+
+        return result
+
+    def points(
+        self,
+        curves: Sequence[CubicBezier | CompositeCubicBezier],
+        resolution: int = 100,
+    ) -> list[list[Vector2f]]:
+        """
+        Calculates `resolution` + 1 points along each curve segment.
+
+        The point shared by adjacent segments of a composite curve is included
+        only once, as in `CompositeCubicBezier.points`.
+        """
+
+        if resolution < 1:
+            raise ValueError(f"resolution ({resolution}) must be >= 1")
+
+        result: list[list[Vector2f]] = []
+
+        for segments in self._evaluate("points", curves, 0.0, resolution):
+            points: list[Vector2f] = []
+
+            for index, values in enumerate(segments):
+                first = 0 if index == 0 else 2
+
+                for i in range(first, len(values), 2):
+                    points.append(Vector2f(values[i], values[i + 1]))
+
+            result.append(points)
+
+        return result
+
+    def _evaluate(
+        self,
+        operation: Operation,
+        curves: Sequence[CubicBezier | CompositeCubicBezier],
+        x: float,
+        resolution: int,
+    ) -> list[list[Sequence[float]]]:
+        segments = float_array(self._typecode)
+        segment_counts: list[int] = []
+
+        for curve in curves:
+            if isinstance(curve, CompositeCubicBezier):
+                segments.extend(curve.to_array(self._typecode))
+                segment_counts.append(len(curve))
+            else:
+                for anchor in (curve.a0, curve.a1, curve.a2, curve.a3):
+                    extend_float_array(segments, anchor.vector)
+                segment_counts.append(1)
+
+        total = len(segments) // 8
+        width = _slot_width(operation, resolution)
+        itemsize = self._itemsize
+
+        if total < max(self._min_batch, 1) or self._max_workers < 2:
+            logger.debug("Evaluating %i segments serially", total)
+            values = float_array(self._typecode)
+            values.frombytes(bytes(total * width * itemsize))
+            counts: array[int] = array("q", bytes(total * 8))
+
+            _evaluate_range(
+                operation,
+                segments,
+                values,
+                counts,
+                0,
+                total,
+                x,
+                resolution,
+            )
+
+            return self._split(values, counts, segment_counts, width)
+
+        logger.debug("Evaluating %i segments in parallel", total)
+
+        blocks = [
+            SharedMemory(create=True, size=max(size, 1))
+            for size in (
+                len(segments) * itemsize,
+                total * width * itemsize,
+                total * 8,
+            )
+        ]
+
+        try:
+            packed = segments.tobytes()
+            _buffer(blocks[0])[: len(packed)] = packed
+
+            # Several tasks per worker keeps the pool busy when segments vary
+            # in cost.
+            step = ceil(total / (self._max_workers * 4))
+
+            tasks: list[Task] = [
+                (
+                    operation,
+                    self._typecode,
+                    blocks[0].name,
+                    blocks[1].name,
+                    blocks[2].name,
+                    start,
+                    min(start + step, total),
+                    x,
+                    resolution,
+                )
+                for start in range(0, total, step)
+            ]
+
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self._max_workers)
+
+            for _ in self._pool.map(_evaluate_shared, tasks):
+                pass
+
+            values = float_array(self._typecode)
+            values.frombytes(_buffer(blocks[1])[: total * width * itemsize])
+            counts = array("q", _buffer(blocks[2]).cast("q")[:total])
+
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return self._split(values, counts, segment_counts, width)
+
+    @staticmethod
+    def _split(
+        values: array[float],
+        counts: array[int],
+        segment_counts: list[int],
+        width: int,
+    ) -> list[list[Sequence[float]]]:
+        result: list[list[Sequence[float]]] = []
+        index = 0
+
+        for segment_count in segment_counts:
+            curve: list[Sequence[float]] = []
+
+            for _ in range(segment_count):
+                start = index * width
+                end = start + counts[index]
+                curve.append(values[start:end])
+                index += 1
+
+            result.append(curve)
+
+        return result
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator
+
+from bendy.precision import Typecode, extend_float_array, float_array
+
+
+def chunk_coordinates(
+    items: Iterable[Iterable[float]],
+    size: int,
+    typecode: Typecode = "d",
+) -> Iterator[array[float]]:
+    """
+    Packs the coordinates of each item into flat arrays of at most `size`
+    items each.
+
+    Only one chunk is held in memory at a time. The final chunk may be short.
+    `typecode` selects float64 ("d") or float32 ("f") chunks.
+    """
+
+    if size < 1:
+        raise ValueError(f"size ({size}) must be >= 1")
+
+    chunk = float_array(typecode)
+    count = 0
+
+    for item in items:
+        extend_float_array(chunk, item)
+        count += 1
+
+        if count == size:
+            yield chunk
+            chunk = float_array(typecode)
+            count = 0
+
+    if count:
+        yield chunk
@@ -1,9 +1,22 @@
-from typing import Any, Iterable, Iterator
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator, Sequence
 
 from vecked import Region2f, Vector2f
 
+from bendy.chunks import chunk_coordinates
 from bendy.cubic_bezier import CubicBezier
-from bendy.logging import logger
+from bendy.drawing import validate_image_draw, visible_resolution
+from bendy.precision import Typecode, extend_float_array, float_array
+from bendy.winding_index import FillRule, WindingIndex
+
+Resolution = int | Sequence[int]
+"""
+Either one resolution for every curve or a plan of one resolution per curve,
+such as from `CompositeCubicBezier.resolution_plan`.
+"""
 
 
 class CompositeCubicBezier:
@@ -15,6 +28,9 @@ class CompositeCubicBezier:
     def __init__(self, initial: CubicBezier) -> None:
         self._curves: list[CubicBezier] = [initial]
 
+    def __iter__(self) -> Iterator[CubicBezier]:
+        return iter(self._curves)
+
     def __len__(self) -> int:
         return len(self._curves)
 
@@ -30,6 +46,37 @@ class CompositeCubicBezier:
             self.max - self.min,
         )
 
+    def contains(
+        self,
+        point: tuple[float, float] | Vector2f,
+        fill_rule: FillRule = "nonzero",
+        resolution: Resolution = 100,
+    ) -> bool:
+        """
+        Checks whether `point` is inside the path.
+
+        The path is flattened into `resolution` lines per curve and closed
+        implicitly, so the boundary is accurate to the flattening tolerance.
+        `fill_rule` is either "nonzero" or "evenodd".
+        """
+
+        return self.winding_index(resolution).contains(point, fill_rule)
+
+    def contains_points(
+        self,
+        points: Iterable[tuple[float, float] | Vector2f],
+        fill_rule: FillRule = "nonzero",
+        resolution: Resolution = 100,
+    ) -> list[bool]:
+        """
+        Checks whether each point is inside the path.
+
+        Prefer this to calling `contains` in a loop: the path is flattened and
+        indexed once, and the points are swept in scanline order.
+        """
+
+        return self.winding_index(resolution).contains_points(points, fill_rule)
+
     def draw(
         self,
         image_draw: Any,
@@ -37,20 +84,26 @@ class CompositeCubicBezier:
         axis: bool = True,
         count: int | None = None,
         estimate_y: Iterable[float] | None = None,
-        resolution: int = 100,
+        resolution: Resolution = 100,
         title: str | None = None,
+        curve_bounds: Region2f | None = None,
+        cull: bool = False,
     ) -> None:
-        try:
-            from PIL.ImageDraw import ImageDraw
-        except ImportError:  # pragma: no cover
-            msg = "Install `bendy[draw]` to enable drawing."  # pragma: no cover
-            logger.error(msg)  # pragma: no cover
-            raise  # pragma: no cover
+        """
+        Draws the path into `pixel_bounds`.
 
-        if not isinstance(image_draw, ImageDraw):
-            raise TypeError("image_draw is not PIL.ImageDraw")
+        `curve_bounds` describes the region of the path to draw, and defaults to
+        the whole path. Pass a smaller region to zoom in.
 
-        curve_bounds = self.bounds.accommodate(Vector2f(0, 0))
+        When `cull` is enabled, curves outside of `pixel_bounds` are skipped and
+        each visible curve is drawn with a resolution that follows its on-screen
+        size, up to `resolution`. Runs of curves smaller than a pixel are drawn
+        as one polyline through their ends, without anchors or estimates.
+        """
+
+        validate_image_draw(image_draw)
+
+        curve_bounds = curve_bounds or self.bounds.accommodate(Vector2f(0, 0))
 
         if title:
             image_draw.text(
@@ -69,25 +122,65 @@ class CompositeCubicBezier:
             )
 
         count = len(self._curves) if count is None else count
+        resolutions = self._resolutions(resolution)
+
+        # Pixel coordinates of the current run of sub-pixel curves.
+        span: list[tuple[float, float]] = []
+
+        def draw_span() -> None:
+            if span:
+                image_draw.line(span, fill=(0, 0, 255), width=2)
+                span.clear()
 
         for index in range(count):
-            self._curves[index].draw(
+            curve = self._curves[index]
+            curve_resolution = resolutions[index]
+
+            if cull:
+                visible = visible_resolution(
+                    curve,
+                    curve_bounds,
+                    pixel_bounds,
+                    curve_resolution,
+                )
+
+                if visible == 0:
+                    if not span:
+                        a0 = curve_bounds.interpolate(curve.a0, pixel_bounds)
+                        span.append(a0.vector)
+
+                    a3 = curve_bounds.interpolate(curve.a3, pixel_bounds)
+                    span.append(a3.vector)
+                    continue
+
+                draw_span()
+
+                if visible is None:
+                    continue
+
+                curve_resolution = visible
+
+            curve.draw(
                 image_draw,
                 pixel_bounds,
                 curve_bounds=curve_bounds,
                 estimate_y=estimate_y,
-                resolution=resolution,
+                resolution=curve_resolution,
             )
 
+        draw_span()
+
     def estimate_y(
         self,
         x: float,
-        resolution: int = 100,
+        resolution: Resolution = 100,
     ) -> Iterator[float]:
-        for curve in self._curves:
+        resolutions = self._resolutions(resolution)
+
+        for curve, curve_resolution in zip(self._curves, resolutions):
             estimations = curve.estimate_y(
                 x,
-                resolution=resolution,
+                resolution=curve_resolution,
             )
 
             for y in estimations:
@@ -97,6 +190,86 @@ class CompositeCubicBezier:
     def head(self) -> CubicBezier:
         return self._curves[0]
 
+    @classmethod
+    def from_array(cls, values: Sequence[float]) -> CompositeCubicBezier:
+        """
+        Creates a composite curve from a flat sequence of anchor coordinates.
+
+        `values` holds (a0.x, a0.y, a1.x, a1.y, a2.x, a2.y, a3.x, a3.y) for each
+        curve in turn, as written by `to_array`. Each curve must start where the
+        previous one ends, as curves built by `append` and `loop` do.
+
+        The curves always hold float64 anchors, so building from a float32
+        array keeps its rounding but not its memory saving.
+        """
+
+        length = len(values)
+
+        if length == 0 or length % 8:
+            raise ValueError(f"values length ({length}) must be a multiple of 8")
+
+        curves = [
+            CubicBezier(
+                (values[i], values[i + 1]),
+                (values[i + 2], values[i + 3]),
+                (values[i + 4], values[i + 5]),
+                (values[i + 6], values[i + 7]),
+            )
+            for i in range(0, length, 8)
+        ]
+
+        for index in range(1, len(curves)):
+            end = curves[index - 1].a3
+            start = curves[index].a0
+
+            if start != end:
+                raise ValueError(
+                    f"curve {index} starts at {start} but curve {index - 1} "
+                    f"ends at {end}"
+                )
+
+        composite = cls(curves[0])
+        composite._curves = curves
+        return composite
+
+    def line_chunks(
+        self,
+        resolution: Resolution = 100,
+        size: int = 4096,
+        typecode: Typecode = "d",
+    ) -> Iterator[array[float]]:
+        """
+        Yields the lines of the path in chunks of at most `size` lines.
+
+        Each chunk is a flat array of (x0, y0, x1, y1) values. Chunks support
+        the buffer protocol, so they can be written directly to a file.
+
+        `typecode` "f" halves the size of each chunk by storing float32 values.
+        See `FLOAT32_ERROR` in `bendy.precision` for the error bound.
+        """
+
+        return chunk_coordinates(
+            ((a.x, a.y, b.x, b.y) for a, b in self.lines(resolution)),
+            size,
+            typecode=typecode,
+        )
+
+    def lines(
+        self, resolution: Resolution = 100
+    ) -> Iterator[tuple[Vector2f, Vector2f]]:
+        """
+        Calculates a set of lines that describe the whole path.
+
+        `resolution` describes the number of lines to calculate per curve, or
+        is a plan of one resolution per curve.
+        """
+
+        resolutions = self._resolutions(resolution)
+
+        for curve, curve_resolution in zip(self._curves, resolutions):
+            for line in curve.lines(curve_resolution):
+                yield line
+
     def loop(self) -> None:
         c = self.tail.join_to_start(self.head)
         self._curves.append(c)
@@ -115,6 +288,145 @@ class CompositeCubicBezier:
             min(c.min.y for c in self._curves),
         )
 
+    def point_chunks(
+        self,
+        resolution: Resolution = 100,
+        size: int = 4096,
+        typecode: Typecode = "d",
+    ) -> Iterator[array[float]]:
+        """
+        Yields the points of the path in chunks of at most `size` points.
+
+        Each chunk is a flat array of (x, y) values. Chunks support the buffer
+        protocol, so they can be written directly to a file.
+
+        `typecode` "f" halves the size of each chunk by storing float32 values.
+        See `FLOAT32_ERROR` in `bendy.precision` for the error bound.
+        """
+
+        return chunk_coordinates(
+            (p.vector for p in self.points(resolution)),
+            size,
+            typecode=typecode,
+        )
+
+    def points(self, resolution: Resolution = 100) -> Iterator[Vector2f]:
+        """
+        Calculates a set of points that describe the whole path.
+
+        `resolution` describes the number of lines to calculate per curve, or
+        is a plan of one resolution per curve. The point shared by adjacent
+        curves is yielded only once.
+        """
+
+        resolutions = self._resolutions(resolution)
+
+        yield self.head.a0
+
+        for curve, curve_resolution in zip(self._curves, resolutions):
+            for point in curve.points(curve_resolution + 1, start=1):
+                yield point
+
+    def resolution_plan(self, max_error: float) -> list[int]:
+        """
+        Gets the smallest resolution for each curve that keeps its lines within
+        `max_error` of the curve.
+
+        The plan can be passed as `resolution` to any method that takes one.
+        See `CubicBezier.resolution_for`.
+        """
+
+        return [c.resolution_for(max_error) for c in self._curves]
+
+    def solve(self, u: float, normalized: bool = False) -> Vector2f:
+        """
+        Calculates the (x,y) coordinate for the global value `u`.
+
+        `u` is in [0, n] for a path of n curves, where the integer part selects
+        the curve and the fractional part is the curve's `t`. When `normalized`
+        is enabled, `u` is in [0, 1] across the whole path instead.
+        """
+
+        return self.solve_many([u], normalized=normalized)[0]
+
+    def solve_many(
+        self,
+        u: Iterable[float],
+        normalized: bool = False,
+    ) -> list[Vector2f]:
+        """
+        Calculates the (x,y) coordinate for each global value in `u`.
+
+        See `solve`. Each value is mapped to its curve by a binary search over
+        the curve boundaries, so resampling the whole path is a single call.
+        """
+
+        count = len(self._curves)
+        maximum = 1.0 if normalized else float(count)
+
+        # The global value at which each curve after the first starts.
+        boundaries = range(1, count)
+
+        result: list[Vector2f] = []
+
+        for value in u:
+            # Written this way round so that NaN fails too.
+            if not 0.0 <= value <= maximum:
+                raise ValueError(f"u ({value}) must be >= 0.0 and <= {maximum}")
+
+            scaled = value * count if normalized else value
+            index = bisect_right(boundaries, scaled)
+            t = min(scaled - index, 1.0)
+            result.append(self._curves[index].solve(t))
+
+        return result
+
     @property
     def tail(self) -> CubicBezier:
         return self._curves[len(self._curves) - 1]
+
+    def to_array(self, typecode: Typecode = "d") -> array[float]:
+        """
+        Packs the anchors of every curve into a flat array.
+
+        See `from_array` for the layout. `typecode` "f" halves the size of the
+        array by storing float32 values. Only the array is smaller: the curves
+        themselves stay float64. See `FLOAT32_ERROR` in `bendy.precision` for
+        the error bound.
+        """
+
+        values = float_array(typecode)
+
+        for curve in self._curves:
+            for anchor in (curve.a0, curve.a1, curve.a2, curve.a3):
+                extend_float_array(values, anchor.vector)
+
+        return values
+
+    def winding_index(self, resolution: Resolution = 100) -> WindingIndex:
+        """
+        Builds a winding number index over the flattened path.
+
+        Keep the index to run many containment queries against a path that
+        isn't changing.
+        """
+
+        return WindingIndex(self.points(resolution))
+
+    def _resolutions(self, resolution: Resolution) -> list[int]:
+        if isinstance(resolution, int):
+            resolutions = [resolution] * len(self._curves)
+        else:
+            resolutions = list(resolution)
+
+            if len(resolutions) != len(self._curves):
+                raise ValueError(
+                    f"resolution plan length ({len(resolutions)}) must match "
+                    f"curve count ({len(self._curves)})"
+                )
+
+        for r in resolutions:
+            if r < 1:
+                raise ValueError(f"resolution ({r}) must be >= 1")
+
+        return resolutions
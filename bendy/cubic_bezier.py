@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from math import floor
+from math import ceil, floor, hypot, sqrt
 from typing import Any, Iterable, Iterator
 
 from vecked import Region2f, Vector2f
 
+from bendy.drawing import validate_image_draw
 from bendy.logging import logger
 from bendy.math import inverse_lerp, lerp
 from bendy.point import x_is_between_points
@@ -46,15 +47,7 @@ class CubicBezier:
         resolution: int = 100,
         estimate_y: Iterable[float] | None = None,
     ) -> None:
-        try:
-            from PIL.ImageDraw import ImageDraw
-        except ImportError:  # pragma: no cover
-            msg = "Install `bendy[draw]` to enable drawing."  # pragma: no cover
-            logger.error(msg)  # pragma: no cover
-            raise  # pragma: no cover
-
-        if not isinstance(image_draw, ImageDraw):
-            raise TypeError("image_draw is not PIL.ImageDraw")
+        validate_image_draw(image_draw)
 
         curve_bounds = curve_bounds or self.bounds
 
@@ -139,15 +132,7 @@ class CubicBezier:
         minimum: Vector2f,
         maximum: Vector2f,
     ) -> None:
-        try:
-            from PIL.ImageDraw import ImageDraw
-        except ImportError:  # pragma: no cover
-            msg = "Install `bendy[draw]` to enable drawing."  # pragma: no cover
-            logger.error(msg)  # pragma: no cover
-            raise  # pragma: no cover
-
-        if not isinstance(image_draw, ImageDraw):
-            raise TypeError("image_draw is not PIL.ImageDraw")
+        validate_image_draw(image_draw)
 
         curve_bounds = curve_bounds.accommodate(Vector2f(0, 0))
 
@@ -355,6 +340,26 @@ class CubicBezier:
         for i in range(start, count):
             yield self.solve(i / (count - 1))
 
+    def resolution_for(self, max_error: float) -> int:
+        """
+        Gets the smallest resolution that keeps every line within `max_error`
+        of the curve.
+
+        Each line spans 1 / resolution of t, and a line's distance from the
+        curve is at most (1 / resolution)² / 8 of the curve's largest second
+        derivative. The second derivative is linear in t, so it peaks at
+        t = 0 or t = 1.
+        """
+
+        if max_error <= 0:
+            raise ValueError(f"max_error ({max_error}) must be > 0")
+
+        d0 = self.a0 - (self.a1 * 2) + self.a2
+        d1 = self.a1 - (self.a2 * 2) + self.a3
+        second_derivative = 6 * max(hypot(*d0.vector), hypot(*d1.vector))
+
+        return max(1, ceil(sqrt(second_derivative / (8 * max_error))))
+
     def solve(self, t: float) -> Vector2f:
         """
         Calculates the (x,y) coordinate for the normal value `t`.
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from functools import cache
+from math import ceil, hypot
+from typing import TYPE_CHECKING, Any
+
+from vecked import Region2f, Vector2f
+
+from bendy.logging import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bendy.cubic_bezier import CubicBezier
+
+PIXELS_PER_LINE = 2
+"""
+On-screen length of each line when drawing with level-of-detail.
+"""
+
+
+@cache
+def image_draw_type() -> type:
+    """
+    Gets the `PIL.ImageDraw.ImageDraw` type.
+
+    Pillow is imported on the first call only.
+    """
+
+    try:
+        from PIL.ImageDraw import ImageDraw
+    except ImportError:  # pragma: no cover
+        msg = "Install `bendy[draw]` to enable drawing."  # pragma: no cover
+        logger.error(msg)  # pragma: no cover
+        raise  # pragma: no cover
+
+    return ImageDraw
+
+
+def validate_image_draw(image_draw: Any) -> None:
+    """
+    Raises `TypeError` if `image_draw` isn't a `PIL.ImageDraw.ImageDraw`.
+    """
+
+    if not isinstance(image_draw, image_draw_type()):
+        raise TypeError("image_draw is not PIL.ImageDraw")
+
+
+def visible_resolution(
+    curve: CubicBezier,
+    curve_bounds: Region2f,
+    pixel_bounds: Region2f,
+    resolution: int,
+) -> int | None:
+    """
+    Gets the resolution to draw `curve` at, or `None` if it's outside of the
+    viewport.
+
+    The resolution follows the curve's on-screen size, up to `resolution`. A
+    curve smaller than a pixel gets 0, meaning it should be drawn as a bare
+    line span from its start to its end.
+    """
+
+    anchors = [
+        curve_bounds.interpolate(a, pixel_bounds)
+        for a in (curve.a0, curve.a1, curve.a2, curve.a3)
+    ]
+
+    # The curve never leaves the hull of its anchors.
+    min_x = min(a.x for a in anchors)
+    min_y = min(a.y for a in anchors)
+    max_x = max(a.x for a in anchors)
+    max_y = max(a.y for a in anchors)
+
+    view_a = pixel_bounds.position
+    view_b = pixel_bounds.position + pixel_bounds.size
+
+    if (
+        max_x < min(view_a.x, view_b.x)
+        or min_x > max(view_a.x, view_b.x)
+        or max_y < min(view_a.y, view_b.y)
+        or min_y > max(view_a.y, view_b.y)
+    ):
+        return None
+
+    if max_x - min_x < 1 and max_y - min_y < 1:
+        return 0
+
+    # The control polygon is never shorter than the curve.
+    length = sum(_distance(a, b) for a, b in zip(anchors, anchors[1:]))
+
+    return max(1, min(resolution, ceil(length / PIXELS_PER_LINE)))
+
+
+def _distance(a: Vector2f, b: Vector2f) -> float:
+    return hypot(b.x - a.x, b.y - a.y)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from array import array
+from math import isfinite
+from typing import Iterable, Iterator, Literal
+
+Typecode = Literal["d", "f"]
+"""
+Array typecode for bulk curve data: "d" for float64 or "f" for float32.
+"""
+
+FLOAT32_ERROR = 2**-24
+"""
+Largest relative error of rounding a float64 value to the nearest float32.
+
+Anchors stored as float32 are each within this fraction of their own
+magnitude. Bernstein weights are non-negative and sum to one, so a curve
+rebuilt from float32 anchors solves within `FLOAT32_ERROR` × the largest
+absolute anchor coordinate of the float64 reference. Rounding the solved
+point to float32 too at most doubles that, to about 2⁻²³ × the largest
+absolute anchor coordinate.
+
+The bound holds only for values within ±`FLOAT32_MAX`. Larger finite values
+raise `OverflowError` rather than silently becoming infinite. Values below
+about 1.2e-38 lose relative precision, though their absolute error stays
+below 2⁻¹⁵⁰.
+"""
+
+FLOAT32_MAX = 3.4028234663852886e38
+"""
+Largest finite float32 value.
+"""
+
+
+def extend_float_array(values: array[float], items: Iterable[float]) -> None:
+    """
+    Appends `items` to a float array.
+
+    Raises `OverflowError` if a finite value is out of range of a float32
+    array.
+    """
+
+    if values.typecode == "f":
+        items = _checked_float32(items)
+
+    values.extend(items)
+
+
+def float_array(typecode: Typecode, values: Iterable[float] = ()) -> array[float]:
+    """
+    Creates a float64 ("d") or float32 ("f") array.
+
+    Raises `OverflowError` if a finite value is out of range of float32.
+    """
+
+    if typecode not in ("d", "f"):
+        raise ValueError(f'typecode ({typecode}) must be "d" or "f"')
+
+    result: array[float] = array(typecode)
+    extend_float_array(result, values)
+    return result
+
+
+def _checked_float32(items: Iterable[float]) -> Iterator[float]:
+    for item in items:
+        if isfinite(item) and abs(item) > FLOAT32_MAX:
+            raise OverflowError(f"{item} is out of range of float32")
+
+        yield item
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator
+
+from vecked import Vector2f
+
+from bendy.composite_cubic_bezier import CompositeCubicBezier
+from bendy.cubic_bezier import CubicBezier
+
+_ARGUMENT_COUNTS = {
+    "C": 6,
+    "M": 2,
+    "S": 4,
+    "Z": 0,
+}
+
+_NUMBER_START = frozenset("+-.0123456789")
+_SEPARATORS = frozenset(" \t\n\r\f,")
+
+
+def parse_svg_path(d: str | Iterable[str]) -> list[CompositeCubicBezier]:
+    """
+    Parses an SVG path `d` attribute into one composite curve per subpath.
+
+    `d` can be a string or an iterable of string chunks, such as a file being
+    read in blocks, so very long paths never need to be held in memory twice.
+
+    Only the M, C, S and Z commands (and their relative forms) are supported.
+    S reflects the previous control point as `CubicBezier.join` does. Z closes
+    the subpath with `CompositeCubicBezier.loop`, unless the subpath already
+    ends at its start.
+    """
+
+    result: list[CompositeCubicBezier] = []
+
+    # Anchors of the current subpath, eight values per curve.
+    values: array[float] = array("d")
+
+    start = (0.0, 0.0)
+    current = (0.0, 0.0)
+
+    def finish(close: bool) -> None:
+        if not values:
+            return
+
+        composite = CompositeCubicBezier.from_array(values)
+
+        if close:
+            composite.loop()
+
+        result.append(composite)
+        del values[:]
+
+    for command, args in _commands(d):
+        relative = command.islower()
+        command = command.upper()
+
+        if command == "Z":
+            finish(current != start)
+            current = start
+            continue
+
+        if command == "M":
+            finish(False)
+            current = _point(args, 0, relative, current)
+            start = current
+            continue
+
+        x0, y0 = current
+
+        if command == "C":
+            a1 = _point(args, 0, relative, current)
+            a2 = _point(args, 2, relative, current)
+            a3 = _point(args, 4, relative, current)
+
+        else:
+            if values:
+                # Same reflection as `CubicBezier.join`.
+                a1 = (x0 - (values[-4] - x0), y0 - (values[-3] - y0))
+            else:
+                a1 = current
+
+            a2 = _point(args, 0, relative, current)
+            a3 = _point(args, 2, relative, current)
+
+        values.extend((x0, y0, *a1, *a2, *a3))
+        current = a3
+
+    finish(False)
+    return result
+
+
+def to_svg_path(
+    composites: CompositeCubicBezier | Iterable[CompositeCubicBezier],
+    precision: int = 3,
+) -> str:
+    """
+    Serialises one or more composite curves into an SVG path `d` attribute.
+
+    Coordinates are rounded to `precision` decimal places. Curves that join
+    smoothly are written as S commands. A final curve created by
+    `CompositeCubicBezier.loop` is written as Z, as is a path that already
+    ends at its start.
+    """
+
+    if precision < 0:
+        raise ValueError(f"precision ({precision}) must be >= 0")
+
+    if isinstance(composites, CompositeCubicBezier):
+        composites = [composites]
+
+    def point(*anchors: Vector2f) -> str:
+        return " ".join(_format_number(c, precision) for a in anchors for c in a.vector)
+
+    commands: list[str] = []
+
+    for composite in composites:
+        curves = list(composite)
+
+        # `parse_svg_path` compares rounded coordinates, so these must too. A
+        # loop curve that starts at the head is written out, because Z doesn't
+        # add a curve to a subpath that already ends at its start.
+        start = point(curves[0].a0)
+
+        looped = (
+            len(curves) > 1
+            and point(curves[-1].a0) != start
+            and _is_loop(curves[-2], curves[-1], curves[0])
+        )
+
+        closed = looped or point(curves[-1].a3) == start
+        previous: CubicBezier | None = None
+
+        for curve in curves[:-1] if looped else curves:
+            if previous is None or previous.a3 != curve.a0:
+                commands.append("M" + point(curve.a0))
+
+            if previous is not None and _is_join(previous, curve):
+                commands.append("S" + point(curve.a2, curve.a3))
+            else:
+                commands.append("C" + point(curve.a1, curve.a2, curve.a3))
+
+            previous = curve
+
+        if closed:
+            commands.append("Z")
+
+    return " ".join(commands)
+
+
+def _commands(d: str | Iterable[str]) -> Iterator[tuple[str, list[float]]]:
+    """
+    Groups tokens into commands with their arguments.
+
+    Implicitly repeated commands are yielded once per set of arguments.
+    """
+
+    command: str | None = None
+    args: list[float] = []
+    expected = 0
+
+    for token in _tokens(d):
+        if isinstance(token, str):
+            if command is not None and args:
+                raise ValueError(
+                    f"{command} expects {expected} arguments, not {len(args)}"
+                )
+
+            if token.upper() not in _ARGUMENT_COUNTS:
+                raise ValueError(f"unsupported path command {token}")
+
+            command = token
+            expected = _ARGUMENT_COUNTS[token.upper()]
+
+            if expected == 0:
+                yield command, args
+            continue
+
+        if command is None or expected == 0:
+            raise ValueError(f"unexpected number {token}")
+
+        args.append(token)
+
+        if len(args) == expected:
+            yield command, args
+            args = []
+
+            # Coordinates after a moveto are implicit linetos, which curves
+            # can't describe.
+            if command.upper() == "M":
+                expected = 0
+
+    if command is not None and args:
+        raise ValueError(f"{command} expects {expected} arguments, not {len(args)}")
+
+
+def _format_number(value: float, precision: int) -> str:
+    text = f"{value:.{precision}f}"
+
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+
+    return "0" if text == "-0" else text
+
+
+def _is_join(previous: CubicBezier, curve: CubicBezier) -> bool:
+    return curve.a0 == previous.a3 and curve.a1 == previous.a2.reflect_across(
+        previous.a3
+    )
+
+
+def _is_loop(previous: CubicBezier, curve: CubicBezier, head: CubicBezier) -> bool:
+    looped = previous.join_to_start(head)
+
+    return (
+        curve.a0 == looped.a0
+        and curve.a1 == looped.a1
+        and curve.a2 == looped.a2
+        and curve.a3 == looped.a3
+    )
+
+
+def _point(
+    args: list[float],
+    index: int,
+    relative: bool,
+    current: tuple[float, float],
+) -> tuple[float, float]:
+    x = args[index]
+    y = args[index + 1]
+
+    if relative:
+        return current[0] + x, current[1] + y
+
+    return x, y
+
+
+def _tokens(d: str | Iterable[str]) -> Iterator[str | float]:
+    """
+    Yields each command letter and number in `d`.
+
+    This is a single-pass scanner rather than a regular expression, so it runs
+    in linear time and numbers may span chunk boundaries.
+    """
+
+    chunks = [d] if isinstance(d, str) else d
+    number: list[str] = []
+
+    # Whether the number being read has a decimal point or exponent yet.
+    seen_point = False
+    seen_exponent = False
+
+    def flush() -> float | None:
+        nonlocal seen_point, seen_exponent
+
+        if not number:
+            return None
+
+        text = "".join(number)
+        number.clear()
+        seen_point = False
+        seen_exponent = False
+
+        try:
+            return float(text)
+        except ValueError:
+            raise ValueError(f"invalid number {text}") from None
+
+    for chunk in chunks:
+        for c in chunk:
+            if c.isdigit():
+                number.append(c)
+                continue
+
+            if c in "eE" and number and not seen_exponent:
+                number.append(c)
+                seen_exponent = True
+                continue
+
+            if c in "+-" and number and number[-1] in "eE":
+                number.append(c)
+                continue
+
+            if c == "." and not seen_point and not seen_exponent:
+                number.append(c)
+                seen_point = True
+                continue
+
+            value = flush()
+
+            if value is not None:
+                yield value
+
+            if c in _SEPARATORS:
+                continue
+
+            if c in _NUMBER_START:
+                # Starts the next number, as in "1-2" or "1.5.5".
+                number.append(c)
+                seen_point = c == "."
+                continue
+
+            if c.isalpha():
+                yield c
+                continue
+
+            raise ValueError(f"unexpected character {c}")
+
+    value = flush()
+
+    if value is not None:
+        yield value
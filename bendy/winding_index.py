@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterable, Literal
+
+from vecked import Vector2f
+
+FillRule = Literal["evenodd", "nonzero"]
+
+Edge = tuple[float, float, float, float, float, float, int]
+"""
+(y_min, y_max, x0, y0, x1, y1, direction)
+"""
+
+
+class WindingIndex:
+    """
+    Winding number index over a closed polyline.
+
+    Edges are sorted by the bottom of their y-range so that each query only
+    tests the edges that span its scanline.
+    """
+
+    def __init__(self, vertices: Iterable[Vector2f]) -> None:
+        edges: list[Edge] = []
+
+        first: Vector2f | None = None
+        previous: Vector2f | None = None
+
+        for vertex in vertices:
+            if previous is None:
+                first = vertex
+            else:
+                self._add_edge(edges, previous, vertex)
+
+            previous = vertex
+
+        if first is not None and previous is not None:
+            # Close the path implicitly, as SVG fills do.
+            self._add_edge(edges, previous, first)
+
+        edges.sort()
+
+        self._edges = edges
+        self._y_mins = [e[0] for e in edges]
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    @staticmethod
+    def _add_edge(edges: list[Edge], a: Vector2f, b: Vector2f) -> None:
+        # Horizontal edges never cross a horizontal ray.
+        if a.y == b.y:
+            return
+
+        direction = 1 if b.y > a.y else -1
+
+        edges.append(
+            (
+                min(a.y, b.y),
+                max(a.y, b.y),
+                a.x,
+                a.y,
+                b.x,
+                b.y,
+                direction,
+            )
+        )
+
+    @staticmethod
+    def _crossing(edge: Edge, x: float, y: float) -> int:
+        _, _, x0, y0, x1, y1, direction = edge
+
+        # Sign of the cross product tells us which side of the edge the point
+        # is on without dividing, so the count is exact for the polyline.
+        side = (x1 - x0) * (y - y0) - (x - x0) * (y1 - y0)
+
+        if direction > 0 and side > 0:
+            return 1
+
+        if direction < 0 and side < 0:
+            return -1
+
+        return 0
+
+    @staticmethod
+    def contains_winding(winding: int, fill_rule: FillRule) -> bool:
+        """
+        Interprets a winding number with the given fill rule.
+        """
+
+        if fill_rule == "nonzero":
+            return winding != 0
+
+        if fill_rule == "evenodd":
+            return winding % 2 == 1
+
+        raise ValueError(f'fill_rule ({fill_rule}) must be "nonzero" or "evenodd"')
+
+    def contains(
+        self,
+        point: tuple[float, float] | Vector2f,
+        fill_rule: FillRule = "nonzero",
+    ) -> bool:
+        """
+        Checks whether `point` is inside the path.
+        """
+
+        return self.contains_winding(self.winding(point), fill_rule)
+
+    def contains_points(
+        self,
+        points: Iterable[tuple[float, float] | Vector2f],
+        fill_rule: FillRule = "nonzero",
+    ) -> list[bool]:
+        """
+        Checks whether each point is inside the path.
+
+        Results are returned in the same order as `points`.
+        """
+
+        return [self.contains_winding(w, fill_rule) for w in self.windings(points)]
+
+    def winding(self, point: tuple[float, float] | Vector2f) -> int:
+        """
+        Calculates the winding number of the path around `point`.
+        """
+
+        x, y = point.vector if isinstance(point, Vector2f) else point
+        winding = 0
+
+        # Only edges that start at or below the scanline can span it.
+        for index in range(bisect_right(self._y_mins, y)):
+            edge = self._edges[index]
+
+            if y < edge[1]:
+                winding += self._crossing(edge, x, y)
+
+        return winding
+
+    def windings(
+        self,
+        points: Iterable[tuple[float, float] | Vector2f],
+    ) -> list[int]:
+        """
+        Calculates the winding number of the path around each point.
+
+        The points are swept in scanline order with an active edge list, so
+        each edge is tested only against the points whose y it spans.
+        """
+
+        coordinates = [p.vector if isinstance(p, Vector2f) else p for p in points]
+        order = sorted(range(len(coordinates)), key=lambda i: coordinates[i][1])
+
+        result = [0] * len(coordinates)
+        active: list[Edge] = []
+        next_edge = 0
+        edge_count = len(self._edges)
+        scanline: float | None = None
+
+        for index in order:
+            x, y = coordinates[index]
+
+            if y != scanline:
+                while next_edge < edge_count and self._edges[next_edge][0] <= y:
+                    active.append(self._edges[next_edge])
+                    next_edge += 1
+
+                active = [e for e in active if y < e[1]]
+                scanline = y
+
+            winding = 0
+
+            for edge in active:
+                winding += self._crossing(edge, x, y)
+
+            result[index] = winding
+
+        return result
@@ -1,10 +1,11 @@
 from logging import DEBUG
 
-from pytest import fixture
+from pytest import TerminalReporter, fixture
 from vecked import Vector2f
 
 from bendy import CompositeCubicBezier, CubicBezier
 from bendy.logging import logger
+from tests.differential import reports, summarise
 
 logger.setLevel(DEBUG)
 
@@ -34,3 +35,16 @@ def figure_8() -> CompositeCubicBezier:
     figure_8.loop()
 
     return figure_8
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter) -> None:
+    if not reports:
+        return
+
+    terminalreporter.section("differential accuracy")
+
+    for report in summarise(reports):
+        terminalreporter.write_line(
+            f"{report.name}: {report.curves} curves, "
+            f"max error {report.max_error:g}, {report.speedup:.2f}x speedup"
+        )
@@ -0,0 +1,254 @@
+"""
+Differential accuracy harness.
+
+Compares fast implementations against the pure-Python methods they replace,
+over randomised and adversarial curves, and records both the error and the
+speedup. Every report is collected in `reports` and summarised at the end of
+the test session.
+"""
+
+from math import inf
+from random import Random
+from time import perf_counter
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+from vecked import Vector2f
+
+from bendy import CompositeCubicBezier, CubicBezier
+from bendy.logging import logger
+
+Values = Sequence[float] | Sequence[Vector2f]
+
+
+class Report(NamedTuple):
+    name: str
+    curves: int
+    max_error: float
+    oracle_seconds: float
+    fast_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.oracle_seconds / self.fast_seconds if self.fast_seconds else inf
+
+
+reports: list[Report] = []
+"""
+Every report made by `compare` in this session.
+"""
+
+
+def adversarial_curves() -> list[CubicBezier]:
+    """
+    Curves that are known to be awkward.
+    """
+
+    return [
+        # Cusp at t = 0.5.
+        CubicBezier((0, 0), (3, 3), (0, 3), (3, 0)),
+        # Self-intersecting loop.
+        CubicBezier((0, 0), (4, 4), (-1, 4), (3, 0)),
+        # Collinear anchors, evenly and unevenly spaced.
+        CubicBezier((0, 0), (1, 1), (2, 2), (3, 3)),
+        CubicBezier((0, 0), (5, 5), (-2, -2), (3, 3)),
+        # Vertical tangents at both ends.
+        CubicBezier((0, 0), (0, 5), (4, 5), (4, 0)),
+        # Vertical line.
+        CubicBezier((2, 0), (2, 1), (2, 2), (2, 3)),
+        # Horizontal line.
+        CubicBezier((0, 2), (1, 2), (2, 2), (3, 2)),
+        # Every anchor in the same place.
+        CubicBezier((1, 1), (1, 1), (1, 1), (1, 1)),
+        # Tiny and huge magnitudes.
+        CubicBezier((0, 0), (1e-9, 2e-9), (3e-9, -1e-9), (4e-9, 0)),
+        CubicBezier((-1e12, 0), (0, 1e12), (1e12, -1e12), (2e12, 0)),
+    ]
+
+
+def adversarial_composites() -> list[CompositeCubicBezier]:
+    """
+    Composite curves that are known to be awkward, including degenerate
+    joins from `CubicBezier.join_to_start`.
+    """
+
+    # A curve that already ends where it starts, then loops back to itself.
+    closed = CompositeCubicBezier(CubicBezier((0, 0), (4, 4), (-1, 4), (0, 0)))
+    closed.loop()
+
+    # A single point looped back to itself.
+    point = CompositeCubicBezier(CubicBezier((1, 1), (1, 1), (1, 1), (1, 1)))
+    point.loop()
+
+    # Joins that double back on themselves.
+    doubled = CompositeCubicBezier(CubicBezier((0, 0), (1, 0), (2, 0), (3, 0)))
+    doubled.append(Vector2f(0, 0), Vector2f(0, 0))
+    doubled.loop()
+
+    # A cusp at a join.
+    cusp = CompositeCubicBezier(CubicBezier((0, 0), (0, 2), (2, 2), (2, 0)))
+    cusp.append(Vector2f(2, 2), Vector2f(4, 2))
+
+    return [closed, point, doubled, cusp]
+
+
+def compare(
+    name: str,
+    oracle: Callable[[], Sequence[Values]],
+    fast: Callable[[], Sequence[Values]],
+    tolerance: float = 0.0,
+) -> Report:
+    """
+    Runs `oracle` and `fast`, and asserts that every value from `fast` is
+    within `tolerance` of the value from `oracle`.
+
+    Each callable returns one sequence of floats or vectors per curve.
+    """
+
+    start = perf_counter()
+    expect = oracle()
+    oracle_seconds = perf_counter() - start
+
+    start = perf_counter()
+    actual = fast()
+    fast_seconds = perf_counter() - start
+
+    assert len(actual) == len(expect), f"{name}: curve count differs"
+
+    max_error = 0.0
+
+    for index, (e, a) in enumerate(zip(expect, actual)):
+        assert len(a) == len(e), f"{name}: value count differs for curve {index}"
+
+        for ev, av in zip(flatten(e), flatten(a)):
+            error = abs(ev - av)
+
+            assert error <= tolerance, (
+                f"{name}: curve {index} differs by {error} "
+                f"(expected {ev}, got {av}, tolerance {tolerance})"
+            )
+
+            max_error = max(max_error, error)
+
+    report = Report(name, len(expect), max_error, oracle_seconds, fast_seconds)
+    reports.append(report)
+
+    logger.info(
+        "%s: %i curves, max error %g, %.2fx speedup",
+        report.name,
+        report.curves,
+        report.max_error,
+        report.speedup,
+    )
+
+    return report
+
+
+def flatten(values: Values) -> list[float]:
+    result: list[float] = []
+
+    for value in values:
+        if isinstance(value, Vector2f):
+            result.extend(value.vector)
+        else:
+            result.append(value)
+
+    return result
+
+
+def largest_coordinate(composite: CompositeCubicBezier) -> float:
+    """
+    Gets the largest absolute anchor coordinate of `composite`.
+    """
+
+    return max(abs(v) for v in composite.to_array())
+
+
+def random_curves(seed: int, count: int, scale: float = 1000) -> list[CubicBezier]:
+    """
+    Creates `count` curves with anchors uniformly distributed in
+    [-`scale`, `scale`].
+    """
+
+    random = Random(seed)
+
+    def anchor() -> tuple[float, float]:
+        return random.uniform(-scale, scale), random.uniform(-scale, scale)
+
+    return [CubicBezier(anchor(), anchor(), anchor(), anchor()) for _ in range(count)]
+
+
+def random_composites(
+    seed: int,
+    count: int,
+    length: int = 5,
+    scale: float = 1000,
+) -> list[CompositeCubicBezier]:
+    """
+    Creates `count` looped composite curves of `length` + 1 curves each.
+    """
+
+    random = Random(seed)
+
+    def anchor() -> Vector2f:
+        return Vector2f(random.uniform(-scale, scale), random.uniform(-scale, scale))
+
+    result: list[CompositeCubicBezier] = []
+
+    for head in random_curves(seed, count, scale):
+        composite = CompositeCubicBezier(head)
+
+        for _ in range(length - 1):
+            composite.append(anchor(), anchor())
+
+        composite.loop()
+        result.append(composite)
+
+    return result
+
+
+def ray_cast_winding(polygon: Sequence[Vector2f], x: float, y: float) -> int:
+    """
+    Calculates the winding number of the closed `polygon` around (`x`, `y`) by
+    casting a ray towards +x through every edge.
+
+    This is deliberately brute force, with no index or sweep, so it can check
+    `WindingIndex`.
+    """
+
+    winding = 0
+
+    for index, a in enumerate(polygon):
+        b = polygon[(index + 1) % len(polygon)]
+
+        # Half-open in y, so a ray through a vertex counts it once.
+        if (a.y <= y < b.y) or (b.y <= y < a.y):
+            crossing = a.x + (y - a.y) * (b.x - a.x) / (b.y - a.y)
+
+            if crossing > x:
+                winding += 1 if b.y > a.y else -1
+
+    return winding
+
+
+def summarise(reports: Iterable[Report]) -> list[Report]:
+    """
+    Combines reports with the same name, in order of first appearance.
+    """
+
+    result: dict[str, Report] = {}
+
+    for report in reports:
+        previous = result.get(report.name)
+
+        if previous is not None:
+            report = Report(
+                report.name,
+                previous.curves + report.curves,
+                max(previous.max_error, report.max_error),
+                previous.oracle_seconds + report.oracle_seconds,
+                previous.fast_seconds + report.fast_seconds,
+            )
+
+        result[report.name] = report
+
+    return list(result.values())
@@ -0,0 +1,82 @@
+from pytest import fixture, raises
+
+from bendy import CompositeCubicBezier, CubicBezier
+from bendy.batch_evaluator import BatchEvaluator
+from bendy.precision import FLOAT32_ERROR
+
+
+@fixture
+def curves(
+    cubic_bezier: CubicBezier,
+    figure_8: CompositeCubicBezier,
+) -> list[CubicBezier | CompositeCubicBezier]:
+    return [cubic_bezier, figure_8, cubic_bezier]
+
+
+def test_estimate_y(curves: list[CubicBezier | CompositeCubicBezier]) -> None:
+    expect = [list(c.estimate_y(250)) for c in curves]
+
+    with BatchEvaluator() as evaluator:
+        assert evaluator.estimate_y(curves, 250) == expect
+
+
+def test_estimate_y__parallel(
+    curves: list[CubicBezier | CompositeCubicBezier],
+) -> None:
+    expect = [list(c.estimate_y(250, resolution=10)) for c in curves]
+
+    with BatchEvaluator(max_workers=2, min_batch=0) as evaluator:
+        assert evaluator.estimate_y(curves, 250, resolution=10) == expect
+
+        # The pool is reused.
+        assert evaluator.estimate_y(curves, 250, resolution=10) == expect
+
+
+def test_points(
+    cubic_bezier: CubicBezier,
+    figure_8: CompositeCubicBezier,
+) -> None:
+    with BatchEvaluator(max_workers=2, min_batch=0) as evaluator:
+        result = evaluator.points([figure_8, cubic_bezier], resolution=10)
+
+    assert result == [
+        list(figure_8.points(10)),
+        list(cubic_bezier.points(11)),
+    ]
+
+
+def test_points__resolution(cubic_bezier: CubicBezier) -> None:
+    with raises(ValueError) as ex:
+        BatchEvaluator().points([cubic_bezier], resolution=0)
+
+    assert str(ex.value) == "resolution (0) must be >= 1"
+
+
+def test_points__serial(curves: list[CubicBezier | CompositeCubicBezier]) -> None:
+    result = BatchEvaluator(max_workers=1).points(curves, resolution=10)
+    assert result[1] == list(curves[1].points(10))
+
+
+def test_points__empty() -> None:
+    assert BatchEvaluator(max_workers=2, min_batch=0).points([]) == []
+
+
+def test_points__float32(curves: list[CubicBezier | CompositeCubicBezier]) -> None:
+    with BatchEvaluator(max_workers=2, min_batch=0, typecode="f") as evaluator:
+        parallel = evaluator.points(curves, resolution=10)
+
+    serial = BatchEvaluator(max_workers=1, typecode="f").points(curves, resolution=10)
+    expect = BatchEvaluator().points(curves, resolution=10)
+
+    assert parallel == serial
+
+    for curve, a, b in zip(curves, expect, parallel):
+        bound = (
+            2
+            * FLOAT32_ERROR
+            * max(abs(v) for p in (curve.min, curve.max) for v in p.vector)
+        )
+
+        for pa, pb in zip(a, b):
+            assert abs(pa.x - pb.x) <= bound
+            assert abs(pa.y - pb.y) <= bound
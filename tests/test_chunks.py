@@ -0,0 +1,28 @@
+from pytest import raises
+
+from bendy.chunks import chunk_coordinates
+
+
+def test_chunk_coordinates() -> None:
+    items = [(0, 1), (2, 3), (4, 5)]
+    chunks = chunk_coordinates(items, 2)
+
+    assert [list(c) for c in chunks] == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_chunk_coordinates__empty() -> None:
+    assert list(chunk_coordinates([], 2)) == []
+
+
+def test_chunk_coordinates__size() -> None:
+    with raises(ValueError) as ex:
+        list(chunk_coordinates([], 0))
+
+    assert str(ex.value) == "size (0) must be >= 1"
+
+
+def test_chunk_coordinates__float32() -> None:
+    chunks = list(chunk_coordinates([(0.5, 1.5)], 2, typecode="f"))
+
+    assert chunks[0].typecode == "f"
+    assert list(chunks[0]) == [0.5, 1.5]
@@ -1,11 +1,14 @@
-from math import ceil, floor
+from array import array
+from io import BytesIO
+from math import ceil, floor, nan
 from pathlib import Path
+from typing import Any
 
 from PIL import Image, ImageDraw
-from pytest import raises
+from pytest import MonkeyPatch, mark, raises
 from vecked import Region2f, Vector2f
 
-from bendy import CompositeCubicBezier
+from bendy import CompositeCubicBezier, CubicBezier
 
 
 def draw_composite(
@@ -64,6 +67,67 @@ def test_draw(figure_8: CompositeCubicBezier) -> None:
     )
 
 
+def test_draw__cull(
+    figure_8: CompositeCubicBezier,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    drawn: list[tuple[CubicBezier, int]] = []
+
+    def draw_curve(curve: CubicBezier, *args: Any, **kwargs: Any) -> None:
+        drawn.append((curve, kwargs["resolution"]))
+
+    monkeypatch.setattr(CubicBezier, "draw", draw_curve)
+
+    image = Image.new("RGB", (100, 100), (255, 255, 255))
+    curves = list(figure_8)
+
+    # Zoom in on the bottom-left of the figure, which the second curve misses.
+    figure_8.draw(
+        ImageDraw.Draw(image),
+        Region2f(Vector2f(0, 0), Vector2f(100, 100)),
+        axis=False,
+        curve_bounds=Region2f(Vector2f(150, 40), Vector2f(50, 50)),
+        cull=True,
+        resolution=10,
+    )
+
+    assert drawn == [(curves[0], 10), (curves[2], 10)]
+
+
+def test_draw__sub_pixel(
+    figure_8: CompositeCubicBezier,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    drawn: list[CubicBezier] = []
+    lines: list[list[tuple[float, float]]] = []
+
+    def draw_curve(curve: CubicBezier, *args: Any, **kwargs: Any) -> None:
+        drawn.append(curve)
+
+    monkeypatch.setattr(CubicBezier, "draw", draw_curve)
+
+    image = Image.new("RGB", (100, 100), (255, 255, 255))
+    image_draw = ImageDraw.Draw(image)
+
+    def draw_line(xy: list[tuple[float, float]], **kwargs: Any) -> None:
+        lines.append(list(xy))
+
+    monkeypatch.setattr(image_draw, "line", draw_line)
+
+    # Zoom out until every curve is smaller than a pixel.
+    figure_8.draw(
+        image_draw,
+        Region2f(Vector2f(0, 0), Vector2f(100, 100)),
+        axis=False,
+        curve_bounds=Region2f(Vector2f(0, 0), Vector2f(100_000, 100_000)),
+        cull=True,
+    )
+
+    assert drawn == []
+    assert len(lines) == 1
+    assert len(lines[0]) == len(figure_8) + 1
+
+
 def test_draw__not_draw(figure_8: CompositeCubicBezier) -> None:
     with raises(TypeError) as ex:
         figure_8.draw(
@@ -80,3 +144,187 @@ def test_estimate_y(figure_8: CompositeCubicBezier) -> None:
         219.83032439156645,
         53.44235033259424,
     ]
+
+
+@mark.parametrize(
+    "point, expect",
+    [
+        ((0, 0), False),
+        ((125, 125), True),
+        ((350, 250), True),
+    ],
+)
+def test_contains(
+    figure_8: CompositeCubicBezier,
+    point: tuple[float, float],
+    expect: bool,
+) -> None:
+    assert figure_8.contains(point) is expect
+
+
+def test_contains_points(figure_8: CompositeCubicBezier) -> None:
+    points = [(x, y) for y in range(0, 500, 25) for x in range(0, 500, 25)]
+    expect = [figure_8.contains(p, fill_rule="evenodd") for p in points]
+
+    assert figure_8.contains_points(points, fill_rule="evenodd") == expect
+
+
+def test_winding_index(figure_8: CompositeCubicBezier) -> None:
+    index = figure_8.winding_index()
+    assert index.winding((125, 125)) == 1
+    assert index.winding((350, 250)) == -1
+
+
+def test_line_chunks(figure_8: CompositeCubicBezier) -> None:
+    chunks = list(figure_8.line_chunks(resolution=10, size=7))
+
+    assert [len(c) for c in chunks] == [28, 28, 28, 28, 8]
+
+    flat = [v for c in chunks for v in c]
+    expect = [v for a, b in figure_8.lines(10) for v in (a.x, a.y, b.x, b.y)]
+    assert flat == expect
+
+
+def test_lines(figure_8: CompositeCubicBezier) -> None:
+    lines = list(figure_8.lines(10))
+
+    assert len(lines) == 30
+
+    for previous, line in zip(lines, lines[1:]):
+        assert previous[1] == line[0]
+
+
+def test_point_chunks(figure_8: CompositeCubicBezier) -> None:
+    buffer = BytesIO()
+
+    for chunk in figure_8.point_chunks(resolution=10, size=8):
+        assert len(chunk) <= 16
+        buffer.write(chunk)
+
+    values = array("d", buffer.getvalue())
+    expect = [v for p in figure_8.points(10) for v in p.vector]
+    assert list(values) == expect
+
+
+def test_points(figure_8: CompositeCubicBezier) -> None:
+    points = list(figure_8.points(10))
+    expect = [figure_8.head.a0]
+
+    for curve in figure_8._curves:
+        expect.extend(curve.points(11, start=1))
+
+    assert len(points) == 31
+    assert points == expect
+    assert points[0] == points[-1]
+
+
+def test_points__resolution(figure_8: CompositeCubicBezier) -> None:
+    with raises(ValueError) as ex:
+        list(figure_8.points(0))
+
+    assert str(ex.value) == "resolution (0) must be >= 1"
+
+
+def test_from_array(figure_8: CompositeCubicBezier) -> None:
+    composite = CompositeCubicBezier.from_array(figure_8.to_array())
+
+    assert len(composite) == 3
+    assert list(composite.points(10)) == list(figure_8.points(10))
+
+
+def test_from_array__gap() -> None:
+    with raises(ValueError) as ex:
+        CompositeCubicBezier.from_array(
+            [0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7],
+        )
+
+    assert str(ex.value) == "curve 1 starts at (4, 4) but curve 0 ends at (3, 3)"
+
+
+def test_from_array__length() -> None:
+    with raises(ValueError) as ex:
+        CompositeCubicBezier.from_array([1, 2, 3])
+
+    assert str(ex.value) == "values length (3) must be a multiple of 8"
+
+
+def test_to_array(figure_8: CompositeCubicBezier) -> None:
+    values = figure_8.to_array()
+
+    assert len(values) == 24
+    assert list(values[:8]) == [150, 50, 250, 40, 200, 450, 300, 400]
+
+
+def test_resolution_plan(figure_8: CompositeCubicBezier) -> None:
+    plan = figure_8.resolution_plan(1)
+
+    assert plan == [curve.resolution_for(1) for curve in figure_8]
+    assert len(list(figure_8.points(plan))) == sum(plan) + 1
+    assert list(figure_8.estimate_y(135, resolution=plan))
+
+
+def test_resolution_plan__length(figure_8: CompositeCubicBezier) -> None:
+    with raises(ValueError) as ex:
+        list(figure_8.lines([10, 10]))
+
+    assert str(ex.value) == "resolution plan length (2) must match curve count (3)"
+
+
+def test_resolution_plan__range(figure_8: CompositeCubicBezier) -> None:
+    with raises(ValueError) as ex:
+        list(figure_8.lines([10, 0, 10]))
+
+    assert str(ex.value) == "resolution (0) must be >= 1"
+
+
+@mark.parametrize(
+    "u, normalized, expect",
+    [
+        (0.0, False, Vector2f(150, 50)),
+        (0.5, False, Vector2f(225, 240)),
+        (1.0, False, Vector2f(300, 400)),
+        (3.0, False, Vector2f(150, 50)),
+        (0.5, True, Vector2f(387.5, 243.75)),
+        (1.0, True, Vector2f(150, 50)),
+    ],
+)
+def test_solve(
+    figure_8: CompositeCubicBezier,
+    u: float,
+    normalized: bool,
+    expect: Vector2f,
+) -> None:
+    assert figure_8.solve(u, normalized=normalized) == expect
+
+
+@mark.parametrize(
+    "u, normalized, message",
+    [
+        (-1, False, "u (-1) must be >= 0.0 and <= 3.0"),
+        (3.5, False, "u (3.5) must be >= 0.0 and <= 3.0"),
+        (1.5, True, "u (1.5) must be >= 0.0 and <= 1.0"),
+        (nan, False, "u (nan) must be >= 0.0 and <= 3.0"),
+        (nan, True, "u (nan) must be >= 0.0 and <= 1.0"),
+    ],
+)
+def test_solve__range(
+    figure_8: CompositeCubicBezier,
+    u: float,
+    normalized: bool,
+    message: str,
+) -> None:
+    with raises(ValueError) as ex:
+        figure_8.solve(u, normalized=normalized)
+
+    assert str(ex.value) == message
+
+
+def test_solve_many(figure_8: CompositeCubicBezier) -> None:
+    u = [i / 10 for i in range(30, -1, -1)]
+    expect = [figure_8.solve(v) for v in u]
+
+    assert figure_8.solve_many(u) == expect
+    assert figure_8.solve_many([v / 3 for v in u], normalized=True) == expect
+    assert figure_8.solve_many([i / 10 for i in range(11)]) == list(
+        figure_8.head.points(11)
+    )
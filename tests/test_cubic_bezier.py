@@ -1,4 +1,4 @@
-from math import ceil, floor
+from math import ceil, floor, hypot
 from pathlib import Path
 
 from PIL import Image, ImageDraw
@@ -163,3 +163,41 @@ def test_solve__range(cubic_bezier: CubicBezier) -> None:
 
 def test_str(cubic_bezier: CubicBezier) -> None:
     assert str(cubic_bezier) == "((100, 100), (300, 50), (200, 450), (400, 400))"
+
+
+@mark.parametrize(
+    "max_error, expect",
+    [
+        (10, 7),
+        (1, 21),
+        (0.1, 64),
+    ],
+)
+def test_resolution_for(
+    cubic_bezier: CubicBezier,
+    max_error: float,
+    expect: int,
+) -> None:
+    resolution = cubic_bezier.resolution_for(max_error)
+    assert resolution == expect
+
+    # Every point on the curve is within max_error of its line.
+    for index, (a, b) in enumerate(cubic_bezier.lines(resolution)):
+        for step in range(1, 10):
+            t = (index + step / 10) / resolution
+            p = cubic_bezier.solve(t)
+            line = b - a
+            cross = line.x * (p.y - a.y) - line.y * (p.x - a.x)
+            assert abs(cross) / hypot(line.x, line.y) <= max_error
+
+
+def test_resolution_for__range(cubic_bezier: CubicBezier) -> None:
+    with raises(ValueError) as ex:
+        cubic_bezier.resolution_for(0)
+
+    assert str(ex.value) == "max_error (0) must be > 0"
+
+
+def test_resolution_for__straight() -> None:
+    curve = CubicBezier((0, 0), (1, 1), (2, 2), (3, 3))
+    assert curve.resolution_for(0.001) == 1
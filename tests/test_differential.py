@@ -0,0 +1,210 @@
+from math import hypot
+
+from pytest import fixture, mark
+from vecked import Region2f, Vector2f
+
+from bendy import CompositeCubicBezier, CubicBezier
+from bendy.batch_evaluator import BatchEvaluator
+from bendy.drawing import visible_resolution
+from bendy.precision import FLOAT32_ERROR, Typecode
+from tests.differential import (
+    adversarial_composites,
+    adversarial_curves,
+    compare,
+    largest_coordinate,
+    random_composites,
+    random_curves,
+    ray_cast_winding,
+)
+
+
+@fixture
+def composites() -> list[CompositeCubicBezier]:
+    return random_composites(1, 50) + adversarial_composites()
+
+
+@fixture
+def curves() -> list[CubicBezier]:
+    return random_curves(2, 200) + adversarial_curves()
+
+
+@mark.parametrize("x", [-500, 0, 1, 2, 3, 250.5])
+def test_batch_estimate_y(
+    curves: list[CubicBezier],
+    composites: list[CompositeCubicBezier],
+    x: float,
+) -> None:
+    batch: list[CubicBezier | CompositeCubicBezier] = [*curves, *composites]
+
+    compare(
+        f"BatchEvaluator.estimate_y({x})",
+        lambda: [list(c.estimate_y(x, resolution=50)) for c in batch],
+        lambda: BatchEvaluator(max_workers=1).estimate_y(batch, x, resolution=50),
+    )
+
+
+def test_batch_estimate_y__parallel(
+    curves: list[CubicBezier],
+    composites: list[CompositeCubicBezier],
+) -> None:
+    batch: list[CubicBezier | CompositeCubicBezier] = [*curves, *composites]
+
+    with BatchEvaluator(max_workers=2, min_batch=0) as evaluator:
+        compare(
+            "BatchEvaluator.estimate_y (parallel)",
+            lambda: [list(c.estimate_y(0, resolution=50)) for c in batch],
+            lambda: evaluator.estimate_y(batch, 0, resolution=50),
+        )
+
+
+def test_batch_points(
+    curves: list[CubicBezier],
+    composites: list[CompositeCubicBezier],
+) -> None:
+    def oracle() -> list[list[Vector2f]]:
+        result = [list(c.points(21)) for c in curves]
+        result.extend(list(c.points(20)) for c in composites)
+        return result
+
+    compare(
+        "BatchEvaluator.points",
+        oracle,
+        lambda: BatchEvaluator().points([*curves, *composites], resolution=20),
+    )
+
+
+def test_bounds(composites: list[CompositeCubicBezier]) -> None:
+    for composite in composites:
+        # `solve` can round a point one ulp outside of the anchors' hull.
+        tolerance = 1e-15 * largest_coordinate(composite)
+
+        minimum = composite.min - Vector2f(tolerance, tolerance)
+        maximum = composite.max + Vector2f(tolerance, tolerance)
+
+        for point in composite.points(50):
+            assert minimum.x <= point.x <= maximum.x
+            assert minimum.y <= point.y <= maximum.y
+
+
+def test_contains_points(composites: list[CompositeCubicBezier]) -> None:
+    grid = [(x, y) for y in range(-1000, 1001, 50) for x in range(-1000, 1001, 50)]
+    polygons = [list(c.points(20)) for c in composites]
+
+    compare(
+        "CompositeCubicBezier.contains_points (evenodd)",
+        lambda: [
+            [float(ray_cast_winding(p, x, y) % 2) for x, y in grid] for p in polygons
+        ],
+        lambda: [
+            [float(c) for c in composite.contains_points(grid, "evenodd", 20)]
+            for composite in composites
+        ],
+    )
+
+
+@mark.parametrize("typecode", ["d", "f"])
+def test_point_chunks(
+    composites: list[CompositeCubicBezier],
+    typecode: Typecode,
+) -> None:
+    for composite in composites:
+        tolerance = 0.0
+
+        if typecode == "f":
+            tolerance = FLOAT32_ERROR * largest_coordinate(composite)
+
+        compare(
+            f"point_chunks({typecode})",
+            lambda: [[v for p in composite.points(20) for v in p.vector]],
+            lambda: [
+                [
+                    v
+                    for c in composite.point_chunks(20, size=7, typecode=typecode)
+                    for v in c
+                ]
+            ],
+            tolerance=tolerance,
+        )
+
+
+def test_resolution_for(curves: list[CubicBezier]) -> None:
+    for curve in curves:
+        extent = curve.max - curve.min
+        max_error = max(extent.x, extent.y) / 1000 or 1
+        resolution = curve.resolution_for(max_error)
+
+        for index, (a, b) in enumerate(curve.lines(resolution)):
+            line = b - a
+            length = hypot(line.x, line.y)
+
+            for step in range(1, 8):
+                p = curve.solve((index + step / 8) / resolution)
+
+                if length:
+                    cross = line.x * (p.y - a.y) - line.y * (p.x - a.x)
+                    error = abs(cross) / length
+                else:
+                    error = hypot(p.x - a.x, p.y - a.y)
+
+                # Allow for float64 rounding on huge coordinates.
+                assert error <= max_error * (1 + 1e-9)
+
+
+def test_solve_many(composites: list[CompositeCubicBezier]) -> None:
+    def oracle() -> list[list[Vector2f]]:
+        result: list[list[Vector2f]] = []
+
+        for composite in composites:
+            curves = list(composite)
+            points: list[Vector2f] = []
+
+            for i in range(len(curves) * 50 + 1):
+                index = min(i // 50, len(curves) - 1)
+                points.append(curves[index].solve(i / 50 - index))
+
+            result.append(points)
+
+        return result
+
+    compare(
+        "CompositeCubicBezier.solve_many",
+        oracle,
+        lambda: [
+            c.solve_many([i / 50 for i in range(len(c) * 50 + 1)]) for c in composites
+        ],
+    )
+
+
+def test_visible_resolution(composites: list[CompositeCubicBezier]) -> None:
+    pixel_bounds = Region2f(Vector2f(0, 0), Vector2f(100, 100)).upside_down()
+    culled = 0
+
+    for composite in composites[:50]:
+        # Zoom in on one corner of the path.
+        bounds = composite.bounds
+        curve_bounds = Region2f(bounds.position, bounds.size * 0.25)
+
+        for curve in composite:
+            if visible_resolution(curve, curve_bounds, pixel_bounds, 100) is not None:
+                continue
+
+            culled += 1
+
+            for point in curve.points(200):
+                p = curve_bounds.interpolate(point, pixel_bounds)
+                assert not (0 <= p.x <= 100 and 0 <= p.y <= 100)
+
+    assert culled
+
+
+def test_windings(composites: list[CompositeCubicBezier]) -> None:
+    grid = [(x, y) for y in range(-1000, 1001, 50) for x in range(-1000, 1001, 50)]
+    polygons = [list(c.points(20)) for c in composites]
+
+    compare(
+        "WindingIndex.windings",
+        lambda: [[float(ray_cast_winding(p, x, y)) for x, y in grid] for p in polygons],
+        lambda: [
+            [float(w) for w in c.winding_index(20).windings(grid)] for c in composites
+        ],
+    )
@@ -0,0 +1,38 @@
+from pytest import mark
+from vecked import Region2f, Vector2f
+
+from bendy import CubicBezier
+from bendy.drawing import visible_resolution
+
+pixel_bounds = Region2f(Vector2f(0, 0), Vector2f(100, 100))
+
+
+@mark.parametrize(
+    "curve_bounds, expect",
+    [
+        # Whole curve in view.
+        (Region2f(Vector2f(100, 100), Vector2f(300, 350)), 100),
+        # Zoomed out until the curve is smaller than a pixel.
+        (Region2f(Vector2f(0, 0), Vector2f(100_000, 100_000)), 0),
+        # Zoomed out so the curve is a few pixels long.
+        (Region2f(Vector2f(0, 0), Vector2f(10_000, 10_000)), 5),
+        # Looking to the left of the curve.
+        (Region2f(Vector2f(-500, 100), Vector2f(300, 300)), None),
+        # Looking above the curve.
+        (Region2f(Vector2f(100, 500), Vector2f(300, 300)), None),
+    ],
+)
+def test_visible_resolution(
+    cubic_bezier: CubicBezier,
+    curve_bounds: Region2f,
+    expect: int | None,
+) -> None:
+    resolution = visible_resolution(cubic_bezier, curve_bounds, pixel_bounds, 100)
+    assert resolution == expect
+
+
+def test_visible_resolution__upside_down(cubic_bezier: CubicBezier) -> None:
+    curve_bounds = Region2f(Vector2f(100, 100), Vector2f(300, 350))
+    flipped = pixel_bounds.upside_down()
+
+    assert visible_resolution(cubic_bezier, curve_bounds, flipped, 100) == 100
@@ -0,0 +1,80 @@
+from subprocess import run
+from sys import executable
+
+from pytest import raises
+
+from bendy.logging import logger
+
+MAX_IMPORT_MICROSECONDS = 100_000
+"""
+Generous limit on bendy's cumulative import time, so the check only fails if
+`import bendy` starts loading something heavy.
+"""
+
+
+def import_bendy(then: str = "") -> tuple[list[str], int]:
+    """
+    Imports bendy in a fresh interpreter and returns the loaded module names
+    and bendy's cumulative import time in microseconds.
+    """
+
+    script = "import sys\nimport bendy\n%s\nprint('\\n'.join(sys.modules))" % then
+
+    result = run(
+        [executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    cumulative = 0
+
+    for line in result.stderr.splitlines():
+        if line.endswith("| bendy"):
+            logger.info("Import time (µs): %s", line)
+            # "import time:       self |  cumulative | bendy"
+            cumulative = int(line.split("|")[1])
+
+    return result.stdout.splitlines(), cumulative
+
+
+def test_dir() -> None:
+    import bendy
+
+    assert "CubicBezier" in dir(bendy)
+
+
+def test_getattr__unknown() -> None:
+    import bendy
+
+    with raises(AttributeError) as ex:
+        getattr(bendy, "pizza")
+
+    assert str(ex.value) == "module 'bendy' has no attribute 'pizza'"
+
+
+def test_getattr__submodule() -> None:
+    import bendy
+    from bendy import cubic_bezier
+
+    assert getattr(bendy, "cubic_bezier") is cubic_bezier
+
+
+def test_import__lazy() -> None:
+    modules, cumulative = import_bendy()
+
+    assert [m for m in modules if m.startswith("bendy.")] == []
+    assert 0 < cumulative < MAX_IMPORT_MICROSECONDS
+
+
+def test_import__on_access() -> None:
+    modules, _ = import_bendy("bendy.CubicBezier")
+
+    assert "bendy.cubic_bezier" in modules
+    assert "bendy.composite_cubic_bezier" not in modules
+
+
+def test_import__submodule_on_access() -> None:
+    modules, _ = import_bendy("bendy.svg")
+
+    assert "bendy.svg" in modules
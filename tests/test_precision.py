@@ -0,0 +1,78 @@
+from math import inf
+
+from pytest import fixture, raises
+
+from bendy import CompositeCubicBezier, CubicBezier
+from bendy.precision import FLOAT32_ERROR, float_array
+from tests.differential import compare, largest_coordinate, random_composites
+
+
+@fixture
+def composites() -> list[CompositeCubicBezier]:
+    return random_composites(1, 20, length=10, scale=1e4)
+
+
+def test_float32_anchors(composites: list[CompositeCubicBezier]) -> None:
+    u = [i / 1000 for i in range(1001)]
+
+    for composite in composites:
+        rebuilt = CompositeCubicBezier.from_array(composite.to_array("f"))
+
+        compare(
+            "from_array(to_array('f')).solve_many",
+            lambda: [composite.solve_many(u, normalized=True)],
+            lambda: [rebuilt.solve_many(u, normalized=True)],
+            tolerance=FLOAT32_ERROR * largest_coordinate(composite),
+        )
+
+
+def test_float32_points(composites: list[CompositeCubicBezier]) -> None:
+    for composite in composites:
+        rebuilt = CompositeCubicBezier.from_array(composite.to_array("f"))
+
+        compare(
+            "point_chunks('f') of float32 anchors",
+            lambda: [[v for p in composite.points(20) for v in p.vector]],
+            lambda: [[v for c in rebuilt.point_chunks(20, typecode="f") for v in c]],
+            tolerance=2 * FLOAT32_ERROR * largest_coordinate(composite),
+        )
+
+
+def test_float32_size(cubic_bezier: CubicBezier) -> None:
+    composite = CompositeCubicBezier(cubic_bezier)
+
+    assert composite.to_array("f").itemsize == 4
+    assert composite.to_array().itemsize == 8
+
+
+def test_float_array() -> None:
+    values = float_array("f", [0.1, 0.2])
+
+    assert values.itemsize == 4
+    assert abs(values[0] - 0.1) <= FLOAT32_ERROR * 0.1
+
+
+def test_float_array__infinite() -> None:
+    assert list(float_array("f", [inf, -inf])) == [inf, -inf]
+    assert list(float_array("d", [1e39])) == [1e39]
+
+
+def test_float_array__overflow() -> None:
+    with raises(OverflowError) as ex:
+        float_array("f", [1e39])
+
+    assert str(ex.value) == "1e+39 is out of range of float32"
+
+
+def test_float_array__typecode() -> None:
+    with raises(ValueError) as ex:
+        float_array("i")  # type: ignore[arg-type]
+
+    assert str(ex.value) == 'typecode (i) must be "d" or "f"'
+
+
+def test_to_array__overflow() -> None:
+    composite = CompositeCubicBezier(CubicBezier((0, 0), (1e39, 0), (1, 1), (2, 2)))
+
+    with raises(OverflowError):
+        composite.to_array("f")
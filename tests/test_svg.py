@@ -0,0 +1,144 @@
+from pytest import mark, raises
+from vecked import Vector2f
+
+from bendy import CompositeCubicBezier, CubicBezier
+from bendy.svg import parse_svg_path, to_svg_path
+
+
+def anchors(composite: CompositeCubicBezier) -> list[tuple[float, float]]:
+    return [a.vector for c in composite for a in (c.a0, c.a1, c.a2, c.a3)]
+
+
+def test_parse_svg_path() -> None:
+    result = parse_svg_path("M10 10 C20 10 30 20 30 30 S40 50 50 50")
+
+    assert len(result) == 1
+    assert anchors(result[0]) == [
+        (10, 10),
+        (20, 10),
+        (30, 20),
+        (30, 30),
+        (30, 30),
+        (30, 40),
+        (40, 50),
+        (50, 50),
+    ]
+
+
+def test_parse_svg_path__chunks() -> None:
+    d = "M150 50 C250 40 200 450 300 400 S450 100 250 200 Z"
+    chunks = [d[i : i + 5] for i in range(0, len(d), 5)]  # noqa: E203
+
+    assert anchors(parse_svg_path(chunks)[0]) == anchors(parse_svg_path(d)[0])
+
+
+def test_parse_svg_path__close(figure_8: CompositeCubicBezier) -> None:
+    result = parse_svg_path("M150 50 C250 40 200 450 300 400 S450 100 250 200 Z")
+    assert anchors(result[0]) == anchors(figure_8)
+
+
+def test_parse_svg_path__compact_numbers() -> None:
+    result = parse_svg_path("M1.5.5c1-1,2e1-2E+1.5.5")
+    assert anchors(result[0]) == [(1.5, 0.5), (2.5, -0.5), (21.5, -19.5), (2, 1)]
+
+
+def test_parse_svg_path__relative() -> None:
+    result = parse_svg_path("m10 10 c10 0 20 10 20 20 s10 20 20 20")
+    expect = parse_svg_path("M10 10 C20 10 30 20 30 30 S40 50 50 50")
+
+    assert anchors(result[0]) == anchors(expect[0])
+
+
+def test_parse_svg_path__repeated() -> None:
+    result = parse_svg_path("M0 0 C1 1 2 2 3 3 4 4 5 5 6 6 M7 7 S8 8 9 9")
+
+    assert [len(c) for c in result] == [2, 1]
+    assert anchors(result[1]) == [(7, 7), (7, 7), (8, 8), (9, 9)]
+
+
+@mark.parametrize(
+    "d, message",
+    [
+        ("M0 0 L1 1", "unsupported path command L"),
+        ("M0 0 1 1", "unexpected number 1.0"),
+        ("1 1", "unexpected number 1.0"),
+        ("M0 0 C1 1 2", "C expects 6 arguments, not 3"),
+        ("M0 0 C1 1 2 Z", "C expects 6 arguments, not 3"),
+        ("M0 0 C1 1 2 2 3 3 #", "unexpected character #"),
+        ("M0 0 C1 1 2 2 3 3e+", "invalid number 3e+"),
+    ],
+)
+def test_parse_svg_path__invalid(d: str, message: str) -> None:
+    with raises(ValueError) as ex:
+        parse_svg_path(d)
+
+    assert str(ex.value) == message
+
+
+def test_to_svg_path(figure_8: CompositeCubicBezier) -> None:
+    d = to_svg_path(figure_8)
+
+    assert d == "M150 50 C250 40 200 450 300 400 S450 100 250 200 Z"
+    assert anchors(parse_svg_path(d)[0]) == anchors(figure_8)
+
+
+def test_to_svg_path__discontinuous() -> None:
+    composites = [
+        CompositeCubicBezier(CubicBezier((0, 0), (1, 1), (2, 2), (3, 3))),
+        CompositeCubicBezier(CubicBezier((4, 4), (5, 5), (6, 6), (7, 7))),
+    ]
+
+    assert to_svg_path(composites) == "M0 0 C1 1 2 2 3 3 M4 4 C5 5 6 6 7 7"
+
+
+def test_to_svg_path__precision() -> None:
+    composite = CompositeCubicBezier(
+        CubicBezier((0.1234, -0.0001), (1.5, 1), (2, 2), (3, 3)),
+    )
+
+    composite.append(Vector2f(4, 4), Vector2f(5, 5))
+
+    assert to_svg_path(composite, precision=2) == "M0.12 0 C1.5 1 2 2 3 3 S4 4 5 5"
+    assert to_svg_path(composite, precision=0) == "M0 0 C2 1 2 2 3 3 S4 4 5 5"
+
+
+def test_to_svg_path__precision_range(figure_8: CompositeCubicBezier) -> None:
+    with raises(ValueError) as ex:
+        to_svg_path(figure_8, precision=-1)
+
+    assert str(ex.value) == "precision (-1) must be >= 0"
+
+
+def test_parse_svg_path__close_at_start() -> None:
+    result = parse_svg_path("M 0,0 C 1,1 2,2 0,0 Z")
+
+    assert len(result) == 1
+    assert anchors(result[0]) == [(0, 0), (1, 1), (2, 2), (0, 0)]
+    assert to_svg_path(result) == "M0 0 C1 1 2 2 0 0 Z"
+
+
+def test_to_svg_path__loop_at_start() -> None:
+    composite = CompositeCubicBezier(CubicBezier((0, 0), (4, 4), (-1, 4), (0, 0)))
+    composite.loop()
+
+    d = to_svg_path(composite)
+
+    assert d == "M0 0 C4 4 -1 4 0 0 S-4 -4 0 0 Z"
+    assert anchors(parse_svg_path(d)[0]) == anchors(composite)
+
+
+def test_to_svg_path__loop_at_rounded_start() -> None:
+    composite = CompositeCubicBezier(CubicBezier((0, 0), (1, 1), (2, 2), (3, 3)))
+    composite.append(Vector2f(5, 5), Vector2f(0.0001, 0))
+    composite.loop()
+
+    d = to_svg_path(composite)
+
+    assert d == "M0 0 C1 1 2 2 3 3 S5 5 0 0 S-1 -1 0 0 Z"
+    assert len(parse_svg_path(d)[0]) == 3
+
+
+def test_to_svg_path__smooth_close() -> None:
+    d = "M0 0 C1 1 2 2 3 3 S5 5 0 0 Z"
+
+    assert to_svg_path(parse_svg_path(d)) == d
@@ -0,0 +1,66 @@
+from pytest import mark, raises
+from vecked import Vector2f
+
+from bendy.winding_index import WindingIndex
+
+square = [
+    Vector2f(0, 0),
+    Vector2f(10, 0),
+    Vector2f(10, 10),
+    Vector2f(0, 10),
+]
+
+
+def test_contains__invalid_fill_rule() -> None:
+    index = WindingIndex(square)
+
+    with raises(ValueError) as ex:
+        index.contains((5, 5), "pizza")  # type: ignore[arg-type]
+
+    assert str(ex.value) == 'fill_rule (pizza) must be "nonzero" or "evenodd"'
+
+
+@mark.parametrize(
+    "fill_rule, expect",
+    [
+        ("evenodd", False),
+        ("nonzero", True),
+    ],
+)
+def test_contains__twice_wound(fill_rule: str, expect: bool) -> None:
+    index = WindingIndex(square + square)
+    assert index.contains((5, 5), fill_rule) is expect  # type: ignore[arg-type]
+
+
+def test_len() -> None:
+    # The two horizontal edges never cross a scanline.
+    assert len(WindingIndex(square)) == 2
+
+
+def test_len__empty() -> None:
+    assert len(WindingIndex([])) == 0
+
+
+@mark.parametrize(
+    "point, expect",
+    [
+        ((5, 5), 1),
+        (Vector2f(5, 5), 1),
+        ((-5, 5), 0),
+        ((15, 5), 0),
+        ((5, -5), 0),
+        ((5, 15), 0),
+    ],
+)
+def test_winding(point: tuple[float, float] | Vector2f, expect: int) -> None:
+    assert WindingIndex(square).winding(point) == expect
+
+
+def test_winding__clockwise() -> None:
+    assert WindingIndex(reversed(square)).winding((5, 5)) == -1
+
+
+def test_windings() -> None:
+    index = WindingIndex(square)
+    points = [(x, y) for y in range(-5, 16, 5) for x in range(-5, 16, 5)]
+    assert index.windings(points) == [index.winding(p) for p in points]